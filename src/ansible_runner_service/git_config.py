@@ -11,6 +11,7 @@ class GitProvider:
     host: str           # "dev.azure.com" or "gitlab.company.com"
     orgs: list[str]     # allowed organizations/groups
     credential_env: str  # env var name holding credential
+    clone_jobs: int | None = None  # parallel submodule fetches; None = min(8, cpu count)
 
     def get_credential(self) -> str:
         """Get credential from environment variable."""
@@ -2,13 +2,42 @@
 import importlib.metadata
 import platform
 import subprocess
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from typing import Any, Callable
 
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 
+@dataclass
+class TTLCache:
+    """Single-value cache that recomputes at most once per ``ttl`` seconds.
+
+    Concurrent callers that find the value stale wait on one recompute
+    instead of each running it.
+    """
+    ttl: float
+    _value: Any = None
+    _expires_at: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def get(self, compute: Callable[[], Any]) -> Any:
+        if time.monotonic() < self._expires_at:
+            return self._value
+        with self._lock:
+            if time.monotonic() < self._expires_at:
+                return self._value
+            self._value = compute()
+            self._expires_at = time.monotonic() + self.ttl
+            return self._value
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+
 def check_redis(redis_client) -> tuple[bool, int]:
     """Check Redis connectivity. Returns (is_ok, latency_ms)."""
     try:
@@ -21,23 +50,34 @@ def check_redis(redis_client) -> tuple[bool, int]:
 
 
 def check_mariadb(session: Session) -> tuple[bool, int]:
-    """Check MariaDB connectivity. Returns (is_ok, latency_ms)."""
+    """Check MariaDB connectivity. Returns (is_ok, latency_ms).
+
+    Checking out the session's connection is the probe: the engine's
+    pool_pre_ping pings the server (COM_PING with pymysql) on checkout, so
+    no SQL is sent. Pass a fresh session, as the health endpoints do.
+    """
     try:
         start = time.perf_counter()
-        session.execute(text("SELECT 1"))
+        session.connection()
         latency_ms = int((time.perf_counter() - start) * 1000)
         return True, latency_ms
     except Exception:
         return False, 0
 
 
+# RQ registers every queue key in this set, so reading it avoids KEYS rq:queue:*
+RQ_QUEUES_KEY = "rq:queues"
+
+
 def get_worker_info(redis_client) -> dict:
     """Get RQ worker info from Redis."""
     try:
-        workers = redis_client.smembers("rq:workers")
-        worker_count = len(workers) if workers else 0
+        # One round-trip for both lookups
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.scard("rq:workers")
+        pipe.smembers(RQ_QUEUES_KEY)
+        worker_count, queue_keys = pipe.execute()
 
-        queue_keys = redis_client.keys("rq:queue:*")
         queues = [k.decode().replace("rq:queue:", "") for k in queue_keys] if queue_keys else []
 
         return {"count": worker_count, "queues": sorted(queues)}
@@ -45,13 +85,8 @@ def get_worker_info(redis_client) -> dict:
         return {"count": 0, "queues": []}
 
 
-def get_version_info() -> dict:
-    """Get version information."""
-    try:
-        app_version = importlib.metadata.version("ansible-runner-service")
-    except importlib.metadata.PackageNotFoundError:
-        app_version = "unknown"
-
+def _ansible_version_from_cli() -> str:
+    """Fallback for ansible installs without package metadata."""
     try:
         result = subprocess.run(
             ["ansible", "--version"],
@@ -61,9 +96,26 @@ def get_version_info() -> dict:
         )
         first_line = result.stdout.split("\n")[0]
         # Parse "ansible [core 2.20.2]"
-        ansible_version = first_line.split("[core ")[1].rstrip("]") if "[core " in first_line else "unknown"
+        return first_line.split("[core ")[1].rstrip("]") if "[core " in first_line else "unknown"
     except Exception:
-        ansible_version = "unknown"
+        return "unknown"
+
+
+@lru_cache(maxsize=1)
+def get_version_info() -> dict:
+    """Get version information.
+
+    Versions cannot change while the process runs, so this is computed once.
+    """
+    try:
+        app_version = importlib.metadata.version("ansible-runner-service")
+    except importlib.metadata.PackageNotFoundError:
+        app_version = "unknown"
+
+    try:
+        ansible_version = importlib.metadata.version("ansible-core")
+    except importlib.metadata.PackageNotFoundError:
+        ansible_version = _ansible_version_from_cli()
 
     return {
         "app": app_version,
@@ -75,11 +127,13 @@ def get_version_info() -> dict:
 def get_queue_depth(redis_client) -> int:
     """Get total number of jobs in all queues."""
     try:
-        queue_keys = redis_client.keys("rq:queue:*")
-        total = 0
-        for key in queue_keys or []:
-            total += redis_client.llen(key)
-        return total
+        queue_keys = redis_client.smembers(RQ_QUEUES_KEY)
+        if not queue_keys:
+            return 0
+        pipe = redis_client.pipeline(transaction=False)
+        for key in queue_keys:
+            pipe.llen(key)
+        return sum(pipe.execute())
     except Exception:
         return 0
 
@@ -1,6 +1,7 @@
 # src/ansible_runner_service/job_store.py
 import json
 import uuid
+import zlib
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from enum import Enum
@@ -45,6 +46,33 @@ class Job:
     options: dict | None = None
 
 
+# Results at least this large are stored zlib-compressed behind the prefix;
+# smaller ones stay plain JSON, as do entries written before compression
+RESULT_COMPRESS_MIN_BYTES = 1024
+_COMPRESSED_RESULT_PREFIX = b"ZJ\x01"
+
+
+def _encode_result(result: JobResult) -> bytes:
+    payload = json.dumps(asdict(result)).encode()
+    if len(payload) < RESULT_COMPRESS_MIN_BYTES:
+        return payload
+    return _COMPRESSED_RESULT_PREFIX + zlib.compress(payload)
+
+
+def _decode_result(raw: bytes) -> JobResult:
+    if raw.startswith(_COMPRESSED_RESULT_PREFIX):
+        raw = zlib.decompress(raw[len(_COMPRESSED_RESULT_PREFIX):])
+    return JobResult(**json.loads(raw))
+
+
+TERMINAL_STATUSES = frozenset({JobStatus.SUCCESSFUL, JobStatus.FAILED})
+
+
+def job_events_channel(job_id: str) -> str:
+    """Pub/sub channel that receives the job's final status."""
+    return f"job:{job_id}:events"
+
+
 class JobStore:
     def __init__(
         self,
@@ -142,11 +170,15 @@ class JobStore:
         if finished_at:
             updates["finished_at"] = finished_at.isoformat()
         if result:
-            updates["result"] = json.dumps(asdict(result))
+            updates["result"] = _encode_result(result)
         if error:
             updates["error"] = error
         self.redis.hset(self._job_key(job_id), mapping=updates)
 
+        # Wake anyone waiting on the job instead of making them poll
+        if status in TERMINAL_STATUSES:
+            self.redis.publish(job_events_channel(job_id), status.value)
+
     def _save_job(self, job: Job) -> None:
         data = {
             "job_id": job.job_id,
@@ -157,7 +189,7 @@ class JobStore:
             "created_at": job.created_at.isoformat(),
             "started_at": job.started_at.isoformat() if job.started_at else "",
             "finished_at": job.finished_at.isoformat() if job.finished_at else "",
-            "result": json.dumps(asdict(job.result)) if job.result else "",
+            "result": _encode_result(job.result) if job.result else "",
             "error": job.error or "",
             "source_type": job.source_type,
             "source_target": job.source_target,
@@ -172,11 +204,8 @@ class JobStore:
         def get_str(key: str) -> str:
             return data.get(key.encode(), b"").decode()
 
-        result_str = get_str("result")
-        result = None
-        if result_str:
-            result_dict = json.loads(result_str)
-            result = JobResult(**result_dict)
+        result_raw = data.get(b"result", b"")
+        result = _decode_result(result_raw) if result_raw else None
 
         started_str = get_str("started_at")
         finished_str = get_str("finished_at")
@@ -1,13 +1,15 @@
 # src/ansible_runner_service/main.py
+import json
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Union
 
 import yaml
 from fastapi import Depends, FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from redis import Redis
 
 from ansible_runner_service.git_config import load_providers, validate_repo_url
@@ -39,6 +41,7 @@ from ansible_runner_service.repository import JobRepository
 from ansible_runner_service.database import get_engine, get_session
 from sqlalchemy.orm import Session
 from ansible_runner_service.health import (
+    TTLCache,
     check_redis,
     check_mariadb,
     get_worker_info,
@@ -58,17 +61,49 @@ def get_engine_singleton():
     return _engine
 
 
+# Redis client singleton; its connection pool is shared across requests
+_redis = None
+
+
 def get_redis() -> Redis:
-    return Redis()
+    global _redis
+    if _redis is None:
+        _redis = Redis(socket_keepalive=True, health_check_interval=30)
+    return _redis
+
+
+# Separate client for the health endpoints, so only probes get the short
+# socket timeouts; job submission and the job store keep the defaults
+_probe_redis = None
+REDIS_PROBE_TIMEOUT = float(os.getenv("REDIS_PROBE_TIMEOUT", "1.0"))
+
+
+def get_probe_redis() -> Redis:
+    global _probe_redis
+    if _probe_redis is None:
+        _probe_redis = Redis(
+            socket_keepalive=True,
+            socket_timeout=REDIS_PROBE_TIMEOUT,
+            socket_connect_timeout=REDIS_PROBE_TIMEOUT,
+        )
+    return _probe_redis
 
 
 def recover_stale_jobs(repository: JobRepository, redis: Redis) -> None:
     """Mark stale running jobs as failed on startup."""
     stale_jobs = repository.list_stale_running_jobs()
+    if not stale_jobs:
+        return
 
+    # One round-trip for every EXISTS check
+    pipe = redis.pipeline(transaction=False)
     for job in stale_jobs:
+        pipe.exists(f"job:{job.id}")
+    in_redis = pipe.execute()
+
+    for job, exists in zip(stale_jobs, in_redis):
         # Only mark as failed if not in Redis (truly abandoned)
-        if not redis.exists(f"job:{job.id}"):
+        if not exists:
             repository.update_status(
                 job.id,
                 "failed",
@@ -262,6 +297,7 @@ def _build_source_config(source) -> UnifiedSourceConfig:
             repo=source.repo,
             branch=source.branch,
             path=source.path,
+            submodules=source.submodules,
         )
     elif isinstance(source, GitRoleSource):
         return GitRoleSourceConfig(
@@ -432,23 +468,50 @@ def get_job(
     )
 
 
+# Constant probe response, built once and returned as-is. Reuse is safe
+# because these handlers take no BackgroundTasks, so FastAPI never attaches
+# per-request state to it.
+_HEALTH_OK = Response(content=b'{"status":"ok"}', media_type="application/json")
+
+
 @app.get("/health/live")
 async def health_live():
     """Liveness probe - returns ok if process is running."""
-    return {"status": "ok"}
+    return _HEALTH_OK
+
+
+# Runs the Redis probe alongside the MariaDB probe on the request thread
+_probe_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+
+
+def _check_dependencies(
+    redis: Redis, session: Session
+) -> tuple[tuple[bool, int], tuple[bool, int]]:
+    """Probe Redis and MariaDB concurrently; latency is max of the two, not the sum."""
+    redis_future = _probe_pool.submit(check_redis, redis)
+    mariadb_result = check_mariadb(session)
+    return redis_future.result(), mariadb_result
+
+
+_ready_cache = TTLCache(ttl=float(os.getenv("HEALTH_READY_TTL_SECONDS", "1.0")))
 
 
 @app.get("/health/ready")
 def health_ready(
-    redis: Redis = Depends(get_redis),
+    redis: Redis = Depends(get_probe_redis),
     session: Session = Depends(get_db_session),
 ):
-    """Readiness probe - returns ok if Redis and MariaDB are reachable."""
-    redis_ok, _ = check_redis(redis)
-    mariadb_ok, _ = check_mariadb(session)
+    """Readiness probe - returns ok if Redis and MariaDB are reachable.
+
+    Results are reused for HEALTH_READY_TTL_SECONDS so frequent probes from
+    Kubernetes and load balancers do not each hit Redis and MariaDB.
+    """
+    redis_ok, mariadb_ok = _ready_cache.get(
+        lambda: tuple(ok for ok, _ in _check_dependencies(redis, session))
+    )
 
     if redis_ok and mariadb_ok:
-        return {"status": "ok"}
+        return _HEALTH_OK
 
     reasons = []
     if not redis_ok:
@@ -462,14 +525,30 @@ def health_ready(
     )
 
 
+_details_cache = TTLCache(ttl=float(os.getenv("HEALTH_DETAILS_TTL_SECONDS", "2.0")))
+
+
 @app.get("/health/details")
 def health_details(
-    redis: Redis = Depends(get_redis),
+    redis: Redis = Depends(get_probe_redis),
     session: Session = Depends(get_db_session),
 ):
-    """Full health details for debugging and observability."""
-    redis_ok, redis_latency = check_redis(redis)
-    mariadb_ok, mariadb_latency = check_mariadb(session)
+    """Full health details for debugging and observability.
+
+    The rendered JSON body is reused for HEALTH_DETAILS_TTL_SECONDS, so
+    scrapers polling this endpoint do not each repeat every Redis and DB call.
+    """
+    body = _details_cache.get(
+        lambda: json.dumps(_collect_health_details(redis, session)).encode()
+    )
+    return Response(content=body, media_type="application/json")
+
+
+def _collect_health_details(redis: Redis, session: Session) -> dict:
+    """Probe every dependency and collect metrics for /health/details."""
+    (redis_ok, redis_latency), (mariadb_ok, mariadb_latency) = _check_dependencies(
+        redis, session
+    )
 
     overall_status = "ok" if (redis_ok and mariadb_ok) else "error"
 
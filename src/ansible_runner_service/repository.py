@@ -2,8 +2,9 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
 
 from ansible_runner_service.models import JobModel
 
@@ -58,26 +59,36 @@ class JobRepository:
         result_stats: dict[str, Any] | None = None,
         error: str | None = None,
     ) -> bool:
-        """Update job status and related fields. Returns True if job was found and updated."""
-        job = self.get(job_id)
-        if job is None:
-            return False
+        """Update job status and related fields. Returns True if job was found and updated.
 
-        job.status = status
+        Issues one UPDATE ... WHERE id = :id instead of loading the row first.
+        """
+        values: dict[str, Any] = {"status": status}
         if started_at is not None:
-            job.started_at = started_at
+            values["started_at"] = started_at
         if finished_at is not None:
-            job.finished_at = finished_at
+            values["finished_at"] = finished_at
         if result_rc is not None:
-            job.result_rc = result_rc
+            values["result_rc"] = result_rc
         if result_stdout is not None:
-            job.result_stdout = result_stdout
+            values["result_stdout"] = result_stdout
         if result_stats is not None:
-            job.result_stats = result_stats
+            values["result_stats"] = result_stats
         if error is not None:
-            job.error = error
+            values["error"] = error
+
+        result = self.session.execute(
+            update(JobModel).where(JobModel.id == job_id).values(**values),
+            execution_options={"synchronize_session": False},
+        )
+        if result.rowcount == 0:
+            return False
 
         self.session.commit()
+        # A loaded instance would otherwise keep its old values; reload on next access
+        job = self.session.identity_map.get(identity_key(JobModel, job_id))
+        if job is not None:
+            self.session.expire(job, list(values))
         return True
 
     def list_jobs(
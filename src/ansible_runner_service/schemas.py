@@ -1,5 +1,5 @@
 # src/ansible_runner_service/schemas.py
-from typing import Any, Annotated, Literal, TypedDict, Union
+from typing import Any, Annotated, Literal, NotRequired, TypedDict, Union
 
 from pydantic import BaseModel, Discriminator, Field, Tag, field_validator, model_validator
 
@@ -25,6 +25,7 @@ class GitPlaybookSourceConfig(TypedDict):
     repo: str
     branch: str
     path: str
+    submodules: NotRequired[bool]
 
 
 class GitRoleSourceConfig(TypedDict):
@@ -128,6 +129,7 @@ class GitPlaybookSource(BaseModel):
     repo: str
     branch: str = "main"
     path: str
+    submodules: bool = False
 
     @field_validator("path")
     @classmethod
@@ -114,6 +114,7 @@ def _execute_git_playbook(source_config: GitPlaybookSourceConfig, extra_vars, in
             branch=source_config.get("branch", "main"),
             target_dir=repo_dir,
             provider=provider,
+            recurse_submodules=source_config.get("submodules", False),
         )
 
         playbook_path = os.path.join(repo_dir, source_config["path"])
@@ -0,0 +1,164 @@
+# tests/fakes.py
+"""Lightweight typed fakes for the API's Redis, job store and repository dependencies.
+
+Each fake implements only what ``main`` calls and records calls in plain
+lists so tests can assert on them without MagicMock bookkeeping.
+"""
+from typing import Any
+
+from ansible_runner_service.job_store import Job
+from ansible_runner_service.models import JobModel
+
+
+class FakeRedis:
+    """Minimal in-memory Redis fake for the hash, set, list and pub/sub calls we use.
+
+    ``workers`` and ``queues`` seed the ``rq:workers`` and ``rq:queues``
+    sets; ``queue_lengths`` maps queue keys to their LLEN.
+    """
+
+    def __init__(
+        self,
+        workers: set[bytes] | None = None,
+        queues: set[bytes] | None = None,
+        queue_lengths: dict[bytes, int] | None = None,
+    ):
+        self._data: dict[str, dict[bytes, bytes]] = {}
+        self._sets: dict[str, set[bytes]] = {
+            "rq:workers": set(workers or ()),
+            "rq:queues": set(queues or ()),
+        }
+        self._list_lengths = dict(queue_lengths or {})
+        self.published: list[tuple[str, str]] = []
+
+    def ping(self) -> bool:
+        return True
+
+    def hset(self, name: str, key=None, value=None, mapping=None):
+        if name not in self._data:
+            self._data[name] = {}
+        if mapping:
+            for k, v in mapping.items():
+                self._data[name][k.encode() if isinstance(k, str) else k] = (
+                    v.encode() if isinstance(v, str) else v
+                )
+        if key is not None and value is not None:
+            k = key.encode() if isinstance(key, str) else key
+            v = value.encode() if isinstance(value, str) else value
+            self._data[name][k] = v
+
+    def hgetall(self, name: str) -> dict[bytes, bytes]:
+        return dict(self._data.get(name, {}))
+
+    def expire(self, name: str, time: int):
+        pass
+
+    def delete(self, *names):
+        for name in names:
+            self._data.pop(name, None)
+
+    def exists(self, *names) -> int:
+        return sum(1 for name in names if name in self._data)
+
+    def smembers(self, name: str) -> set[bytes]:
+        return set(self._sets.get(name, ()))
+
+    def scard(self, name: str) -> int:
+        return len(self._sets.get(name, ()))
+
+    def llen(self, name) -> int:
+        return self._list_lengths.get(name, 0)
+
+    def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis reads and returns their results from ``execute``."""
+
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._calls: list[tuple[str, tuple]] = []
+
+    def smembers(self, name: str) -> "FakePipeline":
+        self._calls.append(("smembers", (name,)))
+        return self
+
+    def scard(self, name: str) -> "FakePipeline":
+        self._calls.append(("scard", (name,)))
+        return self
+
+    def exists(self, *names) -> "FakePipeline":
+        self._calls.append(("exists", names))
+        return self
+
+    def llen(self, name) -> "FakePipeline":
+        self._calls.append(("llen", (name,)))
+        return self
+
+    def execute(self) -> list:
+        results = [getattr(self._redis, method)(*args) for method, args in self._calls]
+        self._calls = []
+        return results
+
+
+class FakeJobStore:
+    """JobStore stand-in that returns a preset ``job`` from create/get."""
+
+    def __init__(self, job: Job | None = None):
+        self.job = job
+        self.create_job_calls: list[dict[str, Any]] = []
+        self.get_job_calls: list[str] = []
+
+    def create_job(
+        self,
+        playbook: str,
+        extra_vars: dict[str, Any],
+        inventory: str | dict,
+        source_type: str = "local",
+        source_target: str = "playbook",
+        source_repo: str | None = None,
+        source_branch: str | None = None,
+        options: dict | None = None,
+    ) -> Job | None:
+        self.create_job_calls.append({
+            "playbook": playbook,
+            "extra_vars": extra_vars,
+            "inventory": inventory,
+            "source_type": source_type,
+            "source_target": source_target,
+            "source_repo": source_repo,
+            "source_branch": source_branch,
+            "options": options,
+        })
+        return self.job
+
+    def get_job(self, job_id: str) -> Job | None:
+        self.get_job_calls.append(job_id)
+        return self.job
+
+
+class FakeRepository:
+    """JobRepository stand-in backed by a list of ``JobModel`` rows."""
+
+    def __init__(self, jobs: list[JobModel] | None = None):
+        self.jobs = list(jobs or [])
+        self.list_jobs_calls: list[dict[str, Any]] = []
+        self.get_calls: list[str] = []
+
+    def list_jobs(
+        self,
+        status: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[JobModel], int]:
+        self.list_jobs_calls.append({"status": status, "limit": limit, "offset": offset})
+        return self.jobs, len(self.jobs)
+
+    def get(self, job_id: str) -> JobModel | None:
+        self.get_calls.append(job_id)
+        return next((job for job in self.jobs if job.id == job_id), None)
@@ -1,44 +1,84 @@
 # tests/test_api.py
-from datetime import datetime, timezone
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from httpx import AsyncClient, ASGITransport
+from httpx import AsyncClient
 
-from ansible_runner_service.main import app, get_playbooks_dir, get_job_store, get_redis, get_repository
+from ansible_runner_service.git_config import GitProvider
 from ansible_runner_service.job_store import Job, JobStatus, JobResult
+from ansible_runner_service.models import JobModel
+from ansible_runner_service.runner import RunResult
+
+
+FIXED_NOW = datetime(2026, 1, 24, 10, 0, 0, tzinfo=timezone.utc)
+
+# Request payloads shared across tests; treat as read-only.
+LOCAL_SOURCE = {"type": "local", "target": "playbook", "path": "test.yml"}
+WEBSERVERS_INVENTORY = {
+    "type": "inline",
+    "data": {"webservers": {"hosts": {"10.0.1.10": None}}},
+}
+LOCALHOST_INVENTORY = {
+    "type": "inline",
+    "data": {"all": {"hosts": {"localhost": None}}},
+}
+GIT_INVENTORY = {
+    "type": "git",
+    "repo": "https://dev.azure.com/org/project/_git/inventory",
+    "path": "hosts.yml",
+}
+
+PENDING_JOB = Job(
+    job_id="test-123",
+    status=JobStatus.PENDING,
+    playbook="hello.yml",
+    extra_vars={},
+    inventory="localhost,",
+    created_at=FIXED_NOW,
+    source_type="local",
+    source_target="playbook",
+)
+
+SUCCESSFUL_JOB = replace(
+    PENDING_JOB,
+    status=JobStatus.SUCCESSFUL,
+    started_at=FIXED_NOW + timedelta(seconds=1),
+    finished_at=FIXED_NOW + timedelta(seconds=5),
+    result=JobResult(rc=0, stdout="Hello!", stats={}),
+)
+
+SUCCESSFUL_JOB_ROW = JobModel(
+    id="test-123",
+    status="successful",
+    playbook="hello.yml",
+    extra_vars={},
+    inventory="localhost,",
+    created_at=FIXED_NOW,
+    finished_at=FIXED_NOW + timedelta(seconds=5),
+    result_rc=0,
+    result_stdout="PLAY [Hello]...",
+    result_stats={"localhost": {"ok": 1}},
+)
 
 
-# Override playbooks directory for tests
 @pytest.fixture
-def playbooks_dir(tmp_path: Path):
-    # Create test playbook
-    playbook = tmp_path / "hello.yml"
-    playbook.write_text("""
----
-- name: Hello
-  hosts: localhost
-  connection: local
-  gather_facts: false
-  tasks:
-    - name: Greet
-      ansible.builtin.debug:
-        msg: "Hello, {{ name | default('World') }}!"
-""")
-    return tmp_path
+def patched_runner():
+    """Patch main.run_playbook with a fake that greets ``extra_vars["name"]``."""
+    def fake_run_playbook(playbook, extra_vars, inventory, **kwargs):
+        name = extra_vars.get("name", "World")
+        return RunResult(status="successful", rc=0, stdout=f"Hello, {name}!", stats={})
 
-
-@pytest.fixture
-def client(playbooks_dir: Path):
-    app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-    yield AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
-    app.dependency_overrides.clear()
+    with patch("ansible_runner_service.main.run_playbook", autospec=True, side_effect=fake_run_playbook) as mock_run:
+        yield mock_run
 
 
 class TestPostJobs:
-    async def test_successful_job(self, client: AsyncClient):
-        response = await client.post(
+    async def test_successful_job(self, asgi_client: AsyncClient, patched_runner):
+        response = await asgi_client.post(
             "/api/v1/jobs?sync=true",
             json={"source": {"type": "local", "target": "playbook", "path": "hello.yml"}},
         )
@@ -49,18 +89,19 @@ class TestPostJobs:
         assert data["rc"] == 0
         assert "Hello, World!" in data["stdout"]
 
-    async def test_with_extra_vars(self, client: AsyncClient):
-        response = await client.post(
+    async def test_with_extra_vars(self, asgi_client: AsyncClient, patched_runner):
+        response = await asgi_client.post(
             "/api/v1/jobs?sync=true",
             json={"source": {"type": "local", "target": "playbook", "path": "hello.yml"}, "extra_vars": {"name": "Claude"}},
         )
 
         assert response.status_code == 200
         assert "Hello, Claude!" in response.json()["stdout"]
+        assert patched_runner.call_args.kwargs["extra_vars"] == {"name": "Claude"}
 
-    async def test_playbook_not_found(self, client: AsyncClient):
+    async def test_playbook_not_found(self, asgi_client: AsyncClient):
         # Sync mode validates playbook existence and returns 404
-        response = await client.post(
+        response = await asgi_client.post(
             "/api/v1/jobs?sync=true",
             json={"source": {"type": "local", "target": "playbook", "path": "nonexistent.yml"}},
         )
@@ -68,9 +109,9 @@ class TestPostJobs:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    async def test_path_traversal_blocked(self, client: AsyncClient):
+    async def test_path_traversal_blocked(self, asgi_client: AsyncClient):
         # Path traversal is blocked by schema validation (returns 422)
-        response = await client.post(
+        response = await asgi_client.post(
             "/api/v1/jobs",
             json={"source": {"type": "local", "target": "playbook", "path": "../etc/passwd"}},
         )
@@ -79,44 +120,28 @@ class TestPostJobs:
 
 
 class TestAsyncJobs:
-    async def test_submit_async_job(self, playbooks_dir: Path):
+    async def test_submit_async_job(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps):
         """Default behavior - async submission."""
-        mock_job_store = MagicMock()
-        mock_job_store.create_job.return_value = Job(
-            job_id="test-123",
-            status=JobStatus.PENDING,
-            playbook="hello.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime(2026, 1, 21, 10, 0, 0, tzinfo=timezone.utc),
-            source_type="local",
-            source_target="playbook",
-        )
-        mock_redis = MagicMock()
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.enqueue_job") as mock_enqueue:
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={"source": {"type": "local", "target": "playbook", "path": "hello.yml"}},
-                    )
-
-            assert response.status_code == 202
-            data = response.json()
-            assert data["job_id"] == "test-123"
-            assert data["status"] == "pending"
-            mock_enqueue.assert_called_once()
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_submit_sync_job(self, client: AsyncClient):
+        fake_job_store.job = PENDING_JOB
+
+        override_deps(store=fake_job_store, redis=fake_redis)
+        with patch("ansible_runner_service.main.enqueue_job", autospec=True) as mock_enqueue:
+            response = await asgi_client.post(
+                "/api/v1/jobs",
+                json={"source": {"type": "local", "target": "playbook", "path": "hello.yml"}},
+            )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_id"] == "test-123"
+        assert data["status"] == "pending"
+        assert len(fake_job_store.create_job_calls) == 1
+        assert fake_job_store.create_job_calls[0]["playbook"] == "hello.yml"
+        mock_enqueue.assert_called_once()
+
+    async def test_submit_sync_job(self, asgi_client: AsyncClient, patched_runner):
         """Sync mode with ?sync=true."""
-        response = await client.post(
+        response = await asgi_client.post(
             "/api/v1/jobs?sync=true",
             json={"source": {"type": "local", "target": "playbook", "path": "hello.yml"}},
         )
@@ -128,742 +153,391 @@ class TestAsyncJobs:
 
 
 class TestGetJob:
-    async def test_get_job(self, playbooks_dir: Path):
-        mock_job_store = MagicMock()
-        mock_job_store.get_job.return_value = Job(
-            job_id="test-123",
-            status=JobStatus.SUCCESSFUL,
-            playbook="hello.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime(2026, 1, 21, 10, 0, 0, tzinfo=timezone.utc),
-            started_at=datetime(2026, 1, 21, 10, 0, 1, tzinfo=timezone.utc),
-            finished_at=datetime(2026, 1, 21, 10, 0, 5, tzinfo=timezone.utc),
-            result=JobResult(rc=0, stdout="Hello!", stats={}),
-            error=None,
-            source_type="local",
-            source_target="playbook",
-        )
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs/test-123")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["job_id"] == "test-123"
-            assert data["status"] == "successful"
-        finally:
-            app.dependency_overrides.clear()
+    async def test_get_job(self, asgi_client: AsyncClient, fake_job_store, override_deps):
+        fake_job_store.job = SUCCESSFUL_JOB
 
-    async def test_get_job_not_found(self, playbooks_dir: Path):
-        mock_job_store = MagicMock()
-        mock_job_store.get_job.return_value = None
+        override_deps(store=fake_job_store)
+        response = await asgi_client.get("/api/v1/jobs/test-123")
 
-        mock_repo = MagicMock()
-        mock_repo.get.return_value = None
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-        app.dependency_overrides[get_repository] = lambda: mock_repo
+        assert response.status_code == 200
+        data = response.json()
+        assert data["job_id"] == "test-123"
+        assert data["status"] == "successful"
 
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs/nonexistent")
+    async def test_get_job_not_found(self, asgi_client: AsyncClient, fake_job_store, fake_repo, override_deps):
+        override_deps(store=fake_job_store, repo=fake_repo)
+        response = await asgi_client.get("/api/v1/jobs/nonexistent")
 
-            assert response.status_code == 404
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 404
+        assert fake_job_store.get_job_calls == ["nonexistent"]
+        assert fake_repo.get_calls == ["nonexistent"]
 
 
-@pytest.fixture
-def mock_job_store():
-    mock = MagicMock()
-    return mock
+class TestListJobs:
+    @pytest.mark.parametrize(
+        "qs, expected",
+        [
+            ("", {"status": None, "limit": 20, "offset": 0}),
+            ("?status=failed", {"status": "failed", "limit": 20, "offset": 0}),
+            ("?limit=10&offset=20", {"status": None, "limit": 10, "offset": 20}),
+            # Limit is capped at 100
+            ("?limit=200", {"status": None, "limit": 100, "offset": 0}),
+        ],
+        ids=["defaults", "status_filter", "pagination", "limit_capped_at_100"],
+    )
+    async def test_list_jobs_query(
+        self, asgi_client: AsyncClient, fake_job_store, fake_redis, fake_repo, override_deps, qs, expected
+    ):
+        override_deps(store=fake_job_store, redis=fake_redis, repo=fake_repo)
+        response = await asgi_client.get(f"/api/v1/jobs{qs}")
 
+        assert response.status_code == 200
+        data = response.json()
+        assert data["jobs"] == []
+        assert data["total"] == 0
+        assert data["limit"] == expected["limit"]
+        assert data["offset"] == expected["offset"]
+        assert fake_repo.list_jobs_calls == [expected]
 
-@pytest.fixture
-def mock_redis():
-    mock = MagicMock()
-    return mock
+    async def test_list_jobs_with_results(self, asgi_client: AsyncClient, fake_job_store, fake_redis, fake_repo, override_deps):
+        fake_repo.jobs = [SUCCESSFUL_JOB_ROW]
 
+        override_deps(store=fake_job_store, redis=fake_redis, repo=fake_repo)
+        response = await asgi_client.get("/api/v1/jobs")
 
-class TestListJobs:
-    async def test_list_jobs_empty(self, playbooks_dir: Path, mock_job_store, mock_redis):
-        mock_repo = MagicMock()
-        mock_repo.list_jobs.return_value = ([], 0)
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["jobs"] == []
-            assert data["total"] == 0
-            assert data["limit"] == 20
-            assert data["offset"] == 0
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_list_jobs_with_results(self, playbooks_dir: Path, mock_job_store, mock_redis):
-        from ansible_runner_service.models import JobModel
-
-        mock_job = JobModel(
-            id="test-123",
-            status="successful",
-            playbook="hello.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime(2026, 1, 24, 10, 0, 0, tzinfo=timezone.utc),
-            finished_at=datetime(2026, 1, 24, 10, 0, 5, tzinfo=timezone.utc),
-        )
-        mock_repo = MagicMock()
-        mock_repo.list_jobs.return_value = ([mock_job], 1)
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data["jobs"]) == 1
-            assert data["jobs"][0]["job_id"] == "test-123"
-            assert data["jobs"][0]["status"] == "successful"
-            assert data["total"] == 1
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_list_jobs_with_status_filter(self, playbooks_dir: Path, mock_job_store, mock_redis):
-        mock_repo = MagicMock()
-        mock_repo.list_jobs.return_value = ([], 0)
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs?status=failed")
-
-            assert response.status_code == 200
-            mock_repo.list_jobs.assert_called_once_with(
-                status="failed",
-                limit=20,
-                offset=0,
-            )
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_list_jobs_with_pagination(self, playbooks_dir: Path, mock_job_store, mock_redis):
-        mock_repo = MagicMock()
-        mock_repo.list_jobs.return_value = ([], 0)
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs?limit=10&offset=20")
-
-            assert response.status_code == 200
-            mock_repo.list_jobs.assert_called_once_with(
-                status=None,
-                limit=10,
-                offset=20,
-            )
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_list_jobs_limit_capped_at_100(self, playbooks_dir: Path, mock_job_store, mock_redis):
-        mock_repo = MagicMock()
-        mock_repo.list_jobs.return_value = ([], 0)
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_job_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs?limit=200")
-
-            assert response.status_code == 200
-            # Should cap at 100
-            mock_repo.list_jobs.assert_called_once_with(
-                status=None,
-                limit=100,
-                offset=0,
-            )
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["jobs"]) == 1
+        assert data["jobs"][0]["job_id"] == "test-123"
+        assert data["jobs"][0]["status"] == "successful"
+        assert data["total"] == 1
 
 
 class TestGetJobWithDBFallback:
-    async def test_get_job_from_redis(self, playbooks_dir: Path):
+    async def test_get_job_from_redis(self, asgi_client: AsyncClient, fake_job_store, fake_repo, override_deps):
         """Job found in Redis, no DB lookup needed."""
-        from ansible_runner_service.job_store import Job, JobStatus
-
-        mock_job = Job(
-            job_id="test-123",
-            status=JobStatus.SUCCESSFUL,
-            playbook="hello.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime.now(timezone.utc),
-            source_type="local",
-            source_target="playbook",
-        )
-
-        mock_store = MagicMock()
-        mock_store.get_job.return_value = mock_job
-        mock_repo = MagicMock()
+        fake_job_store.job = SUCCESSFUL_JOB
 
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs/test-123")
-        finally:
-            app.dependency_overrides.clear()
+        override_deps(store=fake_job_store, repo=fake_repo)
+        response = await asgi_client.get("/api/v1/jobs/test-123")
 
         assert response.status_code == 200
         # Repository should NOT be called when Redis has the job
-        mock_repo.get.assert_not_called()
+        assert fake_repo.get_calls == []
 
-    async def test_get_job_fallback_to_db(self, playbooks_dir: Path):
+    async def test_get_job_fallback_to_db(self, asgi_client: AsyncClient, fake_job_store, fake_repo, override_deps):
         """Job not in Redis, found in DB."""
-        from ansible_runner_service.models import JobModel
-
-        mock_store = MagicMock()
-        mock_store.get_job.return_value = None  # Not in Redis
-
-        mock_db_job = JobModel(
-            id="test-123",
-            status="successful",
-            playbook="hello.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime(2026, 1, 24, 10, 0, 0, tzinfo=timezone.utc),
-            finished_at=datetime(2026, 1, 24, 10, 0, 5, tzinfo=timezone.utc),
-            result_rc=0,
-            result_stdout="PLAY [Hello]...",
-            result_stats={"localhost": {"ok": 1}},
-        )
+        fake_job_store.job = None  # Not in Redis
 
-        mock_repo = MagicMock()
-        mock_repo.get.return_value = mock_db_job
+        fake_repo.jobs = [SUCCESSFUL_JOB_ROW]
 
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs/test-123")
-        finally:
-            app.dependency_overrides.clear()
+        override_deps(store=fake_job_store, repo=fake_repo)
+        response = await asgi_client.get("/api/v1/jobs/test-123")
 
         assert response.status_code == 200
         data = response.json()
         assert data["job_id"] == "test-123"
         assert data["status"] == "successful"
-        mock_repo.get.assert_called_once_with("test-123")
+        assert fake_repo.get_calls == ["test-123"]
 
-    async def test_get_job_not_in_redis_or_db(self, playbooks_dir: Path):
+    async def test_get_job_not_in_redis_or_db(self, asgi_client: AsyncClient, fake_job_store, fake_repo, override_deps):
         """Job not found anywhere."""
-        mock_store = MagicMock()
-        mock_store.get_job.return_value = None
-
-        mock_repo = MagicMock()
-        mock_repo.get.return_value = None
+        fake_job_store.job = None
 
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/api/v1/jobs/test-123")
-        finally:
-            app.dependency_overrides.clear()
+        override_deps(store=fake_job_store, repo=fake_repo)
+        response = await asgi_client.get("/api/v1/jobs/test-123")
 
         assert response.status_code == 404
 
 
 class TestSubmitJobWithDB:
-    async def test_submit_async_writes_to_db(self, playbooks_dir: Path):
-        from unittest.mock import MagicMock, patch
-        from ansible_runner_service.job_store import Job, JobStatus
-        from datetime import datetime, timezone
-
-        mock_job = Job(
-            job_id="test-123",
-            status=JobStatus.PENDING,
-            playbook="hello.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime.now(timezone.utc),
-            source_type="local",
-            source_target="playbook",
-        )
-
-        mock_store = MagicMock()
-        mock_store.create_job.return_value = mock_job
-        mock_repo = MagicMock()
+    async def test_submit_async_writes_to_db(self, asgi_client: AsyncClient, fake_job_store, fake_repo, override_deps):
+        fake_job_store.job = PENDING_JOB
+
+        override_deps(store=fake_job_store, repo=fake_repo)
+        with patch("ansible_runner_service.main.enqueue_job", autospec=True):
+            response = await asgi_client.post(
+                "/api/v1/jobs",
+                json={"source": {"type": "local", "target": "playbook", "path": "hello.yml"}},
+            )
 
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_repository] = lambda: mock_repo
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
+        assert response.status_code == 202
+        assert len(fake_job_store.create_job_calls) == 1
 
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.enqueue_job"):
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={"source": {"type": "local", "target": "playbook", "path": "hello.yml"}},
-                    )
-        finally:
-            app.dependency_overrides.clear()
 
-        assert response.status_code == 202
-        mock_store.create_job.assert_called_once()
+@pytest.fixture
+def git_main_patches():
+    """Patch enqueue_job, load_providers and validate_repo_url in main together."""
+    with patch("ansible_runner_service.main.enqueue_job", autospec=True) as enqueue, \
+         patch("ansible_runner_service.main.load_providers", autospec=True) as load_providers, \
+         patch("ansible_runner_service.main.validate_repo_url", autospec=True) as validate:
+        yield SimpleNamespace(enqueue=enqueue, load_providers=load_providers, validate=validate)
 
 
 class TestSubmitGitSource:
-    async def test_submit_git_playbook(self, playbooks_dir: Path):
+    async def test_submit_git_playbook(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps, git_main_patches):
         """Submit job with Git playbook source."""
-        from ansible_runner_service.job_store import Job, JobStatus
-        from ansible_runner_service.git_config import GitProvider
-
-        mock_store = MagicMock()
-        mock_store.create_job.return_value = Job(
+        fake_job_store.job = replace(
+            PENDING_JOB,
             job_id="git-test-123",
-            status=JobStatus.PENDING,
             playbook="deploy/app.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime(2026, 1, 29, 10, 0, 0, tzinfo=timezone.utc),
             source_type="git",
-            source_target="playbook",
             source_repo="https://dev.azure.com/xxxit/p/_git/r",
             source_branch="main",
         )
 
-        mock_redis_inst = MagicMock()
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis_inst
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.enqueue_job") as mock_enqueue, \
-                     patch("ansible_runner_service.main.load_providers") as mock_providers, \
-                     patch("ansible_runner_service.main.validate_repo_url") as mock_validate:
-                    mock_providers.return_value = [
-                        GitProvider(type="azure", host="dev.azure.com", orgs=["xxxit"], credential_env="AZURE_PAT"),
-                    ]
-                    mock_validate.return_value = mock_providers.return_value[0]
-
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={
-                            "source": {
-                                "type": "git",
-                                "target": "playbook",
-                                "repo": "https://dev.azure.com/xxxit/p/_git/r",
-                                "path": "deploy/app.yml",
-                            },
-                            "inventory": "localhost,",
-                        },
-                    )
-
-            assert response.status_code == 202
-            data = response.json()
-            assert data["job_id"] == "git-test-123"
-
-            # Verify enqueue was called with source_config
-            mock_enqueue.assert_called_once()
-            enqueue_kwargs = mock_enqueue.call_args[1]
-            assert enqueue_kwargs["source_config"]["type"] == "git"
-            assert enqueue_kwargs["source_config"]["target"] == "playbook"
-            assert enqueue_kwargs["source_config"]["repo"] == "https://dev.azure.com/xxxit/p/_git/r"
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_submit_git_playbook_rejected_org(self, playbooks_dir: Path):
+        override_deps(store=fake_job_store, redis=fake_redis)
+        git_main_patches.load_providers.return_value = [
+            GitProvider(type="azure", host="dev.azure.com", orgs=["xxxit"], credential_env="AZURE_PAT"),
+        ]
+        git_main_patches.validate.return_value = git_main_patches.load_providers.return_value[0]
+
+        response = await asgi_client.post(
+            "/api/v1/jobs",
+            json={
+                "source": {
+                    "type": "git",
+                    "target": "playbook",
+                    "repo": "https://dev.azure.com/xxxit/p/_git/r",
+                    "path": "deploy/app.yml",
+                },
+                "inventory": "localhost,",
+            },
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_id"] == "git-test-123"
+
+        # Verify enqueue was called with source_config
+        git_main_patches.enqueue.assert_called_once()
+        enqueue_kwargs = git_main_patches.enqueue.call_args[1]
+        assert enqueue_kwargs["source_config"]["type"] == "git"
+        assert enqueue_kwargs["source_config"]["target"] == "playbook"
+        assert enqueue_kwargs["source_config"]["repo"] == "https://dev.azure.com/xxxit/p/_git/r"
+        assert enqueue_kwargs["source_config"]["submodules"] is False
+
+    async def test_submit_git_playbook_rejected_org(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps, git_main_patches):
         """Reject repo from disallowed organization."""
-        mock_store = MagicMock()
-        mock_redis_inst = MagicMock()
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis_inst
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.load_providers") as mock_providers, \
-                     patch("ansible_runner_service.main.validate_repo_url") as mock_validate:
-                    mock_providers.return_value = []
-                    mock_validate.side_effect = ValueError("Repository not allowed: host 'github.com' is not configured")
-
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={
-                            "source": {
-                                "type": "git",
-                                "target": "playbook",
-                                "repo": "https://github.com/evil/repo.git",
-                                "path": "deploy.yml",
-                            },
-                        },
-                    )
-
-            assert response.status_code == 400
-            assert "not configured" in response.json()["detail"]
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_submit_git_role(self, playbooks_dir: Path):
-        """Submit job with Git role source."""
-        from ansible_runner_service.job_store import Job, JobStatus
-        from ansible_runner_service.git_config import GitProvider
+        override_deps(store=fake_job_store, redis=fake_redis)
+        git_main_patches.load_providers.return_value = []
+        git_main_patches.validate.side_effect = ValueError("Repository not allowed: host 'github.com' is not configured")
+
+        response = await asgi_client.post(
+            "/api/v1/jobs",
+            json={
+                "source": {
+                    "type": "git",
+                    "target": "playbook",
+                    "repo": "https://github.com/evil/repo.git",
+                    "path": "deploy.yml",
+                },
+            },
+        )
 
-        mock_store = MagicMock()
-        mock_store.create_job.return_value = Job(
+        assert response.status_code == 400
+        assert "not configured" in response.json()["detail"]
+
+    async def test_submit_git_role(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps, git_main_patches):
+        """Submit job with Git role source."""
+        fake_job_store.job = replace(
+            PENDING_JOB,
             job_id="role-test-123",
-            status=JobStatus.PENDING,
             playbook="nginx",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime(2026, 1, 29, 10, 0, 0, tzinfo=timezone.utc),
             source_type="git",
             source_target="role",
             source_repo="https://gitlab.company.com/team/col.git",
             source_branch="main",
         )
 
-        mock_redis_inst = MagicMock()
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis_inst
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.enqueue_job") as mock_enqueue, \
-                     patch("ansible_runner_service.main.load_providers") as mock_providers, \
-                     patch("ansible_runner_service.main.validate_repo_url") as mock_validate:
-                    mock_providers.return_value = [
-                        GitProvider(type="gitlab", host="gitlab.company.com", orgs=["team"], credential_env="GL_TOKEN"),
-                    ]
-                    mock_validate.return_value = mock_providers.return_value[0]
-
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={
-                            "source": {
-                                "type": "git",
-                                "target": "role",
-                                "repo": "https://gitlab.company.com/team/col.git",
-                                "role": "nginx",
-                                "role_vars": {"port": 80},
-                            },
-                        },
-                    )
-
-            assert response.status_code == 202
-            data = response.json()
-            assert data["job_id"] == "role-test-123"
-
-            enqueue_kwargs = mock_enqueue.call_args[1]
-            assert enqueue_kwargs["source_config"]["type"] == "git"
-            assert enqueue_kwargs["source_config"]["target"] == "role"
-            assert enqueue_kwargs["source_config"]["role"] == "nginx"
-            assert enqueue_kwargs["source_config"]["role_vars"] == {"port": 80}
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_git_source_sync_rejected(self, playbooks_dir: Path):
+        override_deps(store=fake_job_store, redis=fake_redis)
+        git_main_patches.load_providers.return_value = [
+            GitProvider(type="gitlab", host="gitlab.company.com", orgs=["team"], credential_env="GL_TOKEN"),
+        ]
+        git_main_patches.validate.return_value = git_main_patches.load_providers.return_value[0]
+
+        response = await asgi_client.post(
+            "/api/v1/jobs",
+            json={
+                "source": {
+                    "type": "git",
+                    "target": "role",
+                    "repo": "https://gitlab.company.com/team/col.git",
+                    "role": "nginx",
+                    "role_vars": {"port": 80},
+                },
+            },
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_id"] == "role-test-123"
+
+        enqueue_kwargs = git_main_patches.enqueue.call_args[1]
+        assert enqueue_kwargs["source_config"]["type"] == "git"
+        assert enqueue_kwargs["source_config"]["target"] == "role"
+        assert enqueue_kwargs["source_config"]["role"] == "nginx"
+        assert enqueue_kwargs["source_config"]["role_vars"] == {"port": 80}
+
+    async def test_git_source_sync_rejected(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps, git_main_patches):
         """Sync mode not supported for Git sources."""
-        mock_store = MagicMock()
-        mock_redis_inst = MagicMock()
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis_inst
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.load_providers") as mock_providers, \
-                     patch("ansible_runner_service.main.validate_repo_url") as mock_validate:
-                    from ansible_runner_service.git_config import GitProvider
-                    mock_providers.return_value = [
-                        GitProvider(type="azure", host="dev.azure.com", orgs=["xxxit"], credential_env="AZURE_PAT"),
-                    ]
-                    mock_validate.return_value = mock_providers.return_value[0]
-
-                    response = await client.post(
-                        "/api/v1/jobs?sync=true",
-                        json={
-                            "source": {
-                                "type": "git",
-                                "target": "playbook",
-                                "repo": "https://dev.azure.com/xxxit/p/_git/r",
-                                "path": "deploy.yml",
-                            },
-                        },
-                    )
-
-            assert response.status_code == 400
-            assert "sync" in response.json()["detail"].lower()
-        finally:
-            app.dependency_overrides.clear()
+        override_deps(store=fake_job_store, redis=fake_redis)
+        git_main_patches.load_providers.return_value = [
+            GitProvider(type="azure", host="dev.azure.com", orgs=["xxxit"], credential_env="AZURE_PAT"),
+        ]
+        git_main_patches.validate.return_value = git_main_patches.load_providers.return_value[0]
+
+        response = await asgi_client.post(
+            "/api/v1/jobs?sync=true",
+            json={
+                "source": {
+                    "type": "git",
+                    "target": "playbook",
+                    "repo": "https://dev.azure.com/xxxit/p/_git/r",
+                    "path": "deploy.yml",
+                },
+            },
+        )
+
+        assert response.status_code == 400
+        assert "sync" in response.json()["detail"].lower()
 
 
 class TestSubmitWithInventoryAndOptions:
-    async def test_inline_inventory_accepted(self, playbooks_dir: Path):
+    async def test_inline_inventory_accepted(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps):
         """Inline inventory dict is serialized and passed through."""
-        from ansible_runner_service.job_store import Job, JobStatus
-
-        mock_store = MagicMock()
-        mock_store.create_job.return_value = Job(
+        fake_job_store.job = replace(
+            PENDING_JOB,
             job_id="inv-test-1",
-            status=JobStatus.PENDING,
             playbook="test.yml",
-            extra_vars={},
-            inventory={"type": "inline", "data": {"webservers": {"hosts": {"10.0.1.10": None}}}},
-            created_at=datetime(2026, 2, 1, 10, 0, 0, tzinfo=timezone.utc),
-            source_type="local",
-            source_target="playbook",
+            inventory=WEBSERVERS_INVENTORY,
         )
-        mock_redis_inst = MagicMock()
-
-        (playbooks_dir / "test.yml").write_text("---\n- hosts: all\n  tasks: []")
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis_inst
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.enqueue_job") as mock_enqueue:
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={
-                            "source": {"type": "local", "target": "playbook", "path": "test.yml"},
-                            "inventory": {
-                                "type": "inline",
-                                "data": {"webservers": {"hosts": {"10.0.1.10": None}}},
-                            },
-                        },
-                    )
-
-            assert response.status_code == 202
-
-            # Verify inventory was serialized as dict and passed through
-            create_kwargs = mock_store.create_job.call_args[1]
-            assert create_kwargs["inventory"] == {
-                "type": "inline",
-                "data": {"webservers": {"hosts": {"10.0.1.10": None}}},
-            }
-
-            enqueue_kwargs = mock_enqueue.call_args[1]
-            assert enqueue_kwargs["inventory"] == {
-                "type": "inline",
-                "data": {"webservers": {"hosts": {"10.0.1.10": None}}},
-            }
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_options_accepted(self, playbooks_dir: Path):
-        """Execution options are serialized and passed through."""
-        from ansible_runner_service.job_store import Job, JobStatus
 
-        mock_store = MagicMock()
-        mock_store.create_job.return_value = Job(
+        override_deps(store=fake_job_store, redis=fake_redis)
+        with patch("ansible_runner_service.main.enqueue_job", autospec=True) as mock_enqueue:
+            response = await asgi_client.post(
+                "/api/v1/jobs",
+                json={
+                    "source": LOCAL_SOURCE,
+                    "inventory": WEBSERVERS_INVENTORY,
+                },
+            )
+
+        assert response.status_code == 202
+
+        # Verify inventory was serialized as dict and passed through
+        create_kwargs = fake_job_store.create_job_calls[-1]
+        assert create_kwargs["inventory"] == WEBSERVERS_INVENTORY
+
+        enqueue_kwargs = mock_enqueue.call_args[1]
+        assert enqueue_kwargs["inventory"] == WEBSERVERS_INVENTORY
+
+    async def test_options_accepted(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps):
+        """Execution options are serialized and passed through."""
+        fake_job_store.job = replace(
+            PENDING_JOB,
             job_id="opt-test-1",
-            status=JobStatus.PENDING,
             playbook="test.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime(2026, 2, 1, 10, 0, 0, tzinfo=timezone.utc),
             options={"check": True, "tags": ["deploy"]},
-            source_type="local",
-            source_target="playbook",
         )
-        mock_redis_inst = MagicMock()
-
-        (playbooks_dir / "test.yml").write_text("---\n- hosts: all\n  tasks: []")
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis_inst
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.enqueue_job") as mock_enqueue:
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={
-                            "source": {"type": "local", "target": "playbook", "path": "test.yml"},
-                            "options": {"check": True, "tags": ["deploy"]},
-                        },
-                    )
-
-            assert response.status_code == 202
-
-            # Verify options were serialized (exclude_defaults) and passed through
-            create_kwargs = mock_store.create_job.call_args[1]
-            assert create_kwargs["options"]["check"] is True
-            assert create_kwargs["options"]["tags"] == ["deploy"]
-
-            enqueue_kwargs = mock_enqueue.call_args[1]
-            assert enqueue_kwargs["options"]["check"] is True
-            assert enqueue_kwargs["options"]["tags"] == ["deploy"]
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_string_inventory_still_works(self, playbooks_dir: Path):
-        """String inventory still passes through correctly."""
-        from ansible_runner_service.job_store import Job, JobStatus
 
-        mock_store = MagicMock()
-        mock_store.create_job.return_value = Job(
+        override_deps(store=fake_job_store, redis=fake_redis)
+        with patch("ansible_runner_service.main.enqueue_job", autospec=True) as mock_enqueue:
+            response = await asgi_client.post(
+                "/api/v1/jobs",
+                json={
+                    "source": LOCAL_SOURCE,
+                    "options": {"check": True, "tags": ["deploy"]},
+                },
+            )
+
+        assert response.status_code == 202
+
+        # Verify options were serialized (exclude_defaults) and passed through
+        create_kwargs = fake_job_store.create_job_calls[-1]
+        assert create_kwargs["options"]["check"] is True
+        assert create_kwargs["options"]["tags"] == ["deploy"]
+
+        enqueue_kwargs = mock_enqueue.call_args[1]
+        assert enqueue_kwargs["options"]["check"] is True
+        assert enqueue_kwargs["options"]["tags"] == ["deploy"]
+
+    async def test_string_inventory_still_works(self, asgi_client: AsyncClient, fake_job_store, fake_redis, override_deps):
+        """String inventory still passes through correctly."""
+        fake_job_store.job = replace(
+            PENDING_JOB,
             job_id="str-inv-test-1",
-            status=JobStatus.PENDING,
             playbook="test.yml",
-            extra_vars={},
             inventory="myhost,",
-            created_at=datetime(2026, 2, 1, 10, 0, 0, tzinfo=timezone.utc),
-            source_type="local",
-            source_target="playbook",
         )
-        mock_redis_inst = MagicMock()
 
-        (playbooks_dir / "test.yml").write_text("---\n- hosts: all\n  tasks: []")
+        override_deps(store=fake_job_store, redis=fake_redis)
+        with patch("ansible_runner_service.main.enqueue_job", autospec=True) as mock_enqueue:
+            response = await asgi_client.post(
+                "/api/v1/jobs",
+                json={
+                    "source": LOCAL_SOURCE,
+                    "inventory": "myhost,",
+                },
+            )
+
+        assert response.status_code == 202
+
+        # Verify string inventory passed through as-is
+        create_kwargs = fake_job_store.create_job_calls[-1]
+        assert create_kwargs["inventory"] == "myhost,"
+
+        enqueue_kwargs = mock_enqueue.call_args[1]
+        assert enqueue_kwargs["inventory"] == "myhost,"
 
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-        app.dependency_overrides[get_job_store] = lambda: mock_store
-        app.dependency_overrides[get_redis] = lambda: mock_redis_inst
+    async def test_sync_with_inline_inventory_supported(self, asgi_client: AsyncClient, patched_runner):
+        """Sync mode supports inline inventory."""
+        response = await asgi_client.post(
+            "/api/v1/jobs?sync=true",
+            json={
+                "source": LOCAL_SOURCE,
+                "inventory": LOCALHOST_INVENTORY,
+            },
+        )
 
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                with patch("ansible_runner_service.main.enqueue_job") as mock_enqueue:
-                    response = await client.post(
-                        "/api/v1/jobs",
-                        json={
-                            "source": {"type": "local", "target": "playbook", "path": "test.yml"},
-                            "inventory": "myhost,",
-                        },
-                    )
+        assert response.status_code == 200
+        assert response.json()["status"] == "successful"
+        # Inline inventory is written to a temp file and passed by path
+        assert patched_runner.call_args.kwargs["inventory"].endswith("inventory.yml")
 
-            assert response.status_code == 202
+    async def test_sync_with_git_inventory_rejected(self, asgi_client: AsyncClient):
+        """Sync mode rejects git inventory.
 
-            # Verify string inventory passed through as-is
-            create_kwargs = mock_store.create_job.call_args[1]
-            assert create_kwargs["inventory"] == "myhost,"
+        Unknown inventory types are rejected by JobRequest itself and are
+        covered in test_schemas without going through the app.
+        """
+        response = await asgi_client.post(
+            "/api/v1/jobs?sync=true",
+            json={
+                "source": LOCAL_SOURCE,
+                "inventory": GIT_INVENTORY,
+            },
+        )
 
-            enqueue_kwargs = mock_enqueue.call_args[1]
-            assert enqueue_kwargs["inventory"] == "myhost,"
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 400
+        assert "git inventory" in response.json()["detail"].lower()
 
-    async def test_sync_with_inline_inventory_supported(self, playbooks_dir: Path):
-        """Sync mode supports inline inventory."""
-        (playbooks_dir / "test.yml").write_text(
-            "---\n"
-            "- hosts: all\n"
-            "  connection: local\n"
-            "  gather_facts: false\n"
-            "  tasks:\n"
-            "    - name: Debug\n"
-            "      ansible.builtin.debug:\n"
-            "        msg: 'Hello from inline inventory'\n"
+
+@pytest.mark.integration
+class TestSyncRealRun:
+    async def test_sync_runs_real_playbook(self, asgi_client: AsyncClient):
+        """One real ansible-runner run through the sync API path."""
+        response = await asgi_client.post(
+            "/api/v1/jobs?sync=true",
+            json={
+                "source": {"type": "local", "target": "playbook", "path": "hello.yml"},
+                "extra_vars": {"name": "Claude"},
+                "inventory": LOCALHOST_INVENTORY,
+            },
         )
 
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.post(
-                    "/api/v1/jobs?sync=true",
-                    json={
-                        "source": {"type": "local", "target": "playbook", "path": "test.yml"},
-                        "inventory": {
-                            "type": "inline",
-                            "data": {"all": {"hosts": {"localhost": None}}},
-                        },
-                    },
-                )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "successful"
-            assert "Hello from inline inventory" in data["stdout"]
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_sync_with_git_inventory_rejected(self, playbooks_dir: Path):
-        """Sync mode rejects git inventory with 400."""
-        (playbooks_dir / "test.yml").write_text("---\n- hosts: all\n  tasks: []")
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.post(
-                    "/api/v1/jobs?sync=true",
-                    json={
-                        "source": {"type": "local", "target": "playbook", "path": "test.yml"},
-                        "inventory": {
-                            "type": "git",
-                            "repo": "https://dev.azure.com/org/project/_git/inventory",
-                            "path": "hosts.yml",
-                        },
-                    },
-                )
-
-            assert response.status_code == 400
-            assert "git inventory" in response.json()["detail"].lower()
-        finally:
-            app.dependency_overrides.clear()
-
-    async def test_invalid_inventory_type_rejected(self, playbooks_dir: Path):
-        """Invalid inventory type should be rejected by Pydantic validation."""
-        (playbooks_dir / "test.yml").write_text("---\n- hosts: all\n  tasks: []")
-
-        app.dependency_overrides[get_playbooks_dir] = lambda: playbooks_dir
-
-        try:
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.post(
-                    "/api/v1/jobs",
-                    json={
-                        "source": {"type": "local", "target": "playbook", "path": "test.yml"},
-                        "inventory": {"type": "invalid"},
-                    },
-                )
-
-            assert response.status_code == 422
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "successful"
+        assert data["rc"] == 0
+        assert "Hello, Claude!" in data["stdout"]
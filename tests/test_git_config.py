@@ -1,7 +1,5 @@
 # tests/test_git_config.py
-import os
 import pytest
-from unittest.mock import patch
 
 from ansible_runner_service.git_config import (
     GitProvider,
@@ -10,6 +8,14 @@ from ansible_runner_service.git_config import (
 )
 
 
+SINGLE_PROVIDER_CONFIG = '[{"type": "azure", "host": "dev.azure.com", "orgs": ["xxxit"], "credential_env": "AZURE_PAT"}]'
+
+MULTI_PROVIDER_CONFIG = """[
+    {"type": "azure", "host": "dev.azure.com", "orgs": ["xxxit"], "credential_env": "AZURE_PAT"},
+    {"type": "gitlab", "host": "gitlab.company.com", "orgs": ["platform-team"], "credential_env": "GITLAB_TOKEN"}
+]"""
+
+
 class TestGitProvider:
     def test_create_provider(self):
         provider = GitProvider(
@@ -22,60 +28,56 @@ class TestGitProvider:
         assert provider.host == "dev.azure.com"
         assert "xxxit" in provider.orgs
 
-    def test_get_credential_from_env(self):
+    def test_get_credential_from_env(self, monkeypatch):
         provider = GitProvider(
             type="azure",
             host="dev.azure.com",
             orgs=["xxxit"],
             credential_env="AZURE_PAT",
         )
-        with patch.dict(os.environ, {"AZURE_PAT": "my-token"}):
-            assert provider.get_credential() == "my-token"
+        monkeypatch.setenv("AZURE_PAT", "my-token")
+        assert provider.get_credential() == "my-token"
 
-    def test_get_credential_missing_env(self):
+    def test_get_credential_missing_env(self, monkeypatch):
         provider = GitProvider(
             type="azure",
             host="dev.azure.com",
             orgs=["xxxit"],
             credential_env="MISSING_VAR",
         )
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ValueError, match="not set"):
-                provider.get_credential()
+        monkeypatch.delenv("MISSING_VAR", raising=False)
+        with pytest.raises(ValueError, match="not set"):
+            provider.get_credential()
 
 
 class TestLoadProviders:
-    def test_load_from_env_json(self):
-        config = '[{"type": "azure", "host": "dev.azure.com", "orgs": ["xxxit"], "credential_env": "AZURE_PAT"}]'
-        with patch.dict(os.environ, {"GIT_PROVIDERS": config}):
-            providers = load_providers()
-            assert len(providers) == 1
-            assert providers[0].host == "dev.azure.com"
-
-    def test_load_empty_returns_empty_list(self):
-        with patch.dict(os.environ, {}, clear=True):
-            providers = load_providers()
-            assert providers == []
-
-    def test_load_multiple_providers(self):
-        config = """[
-            {"type": "azure", "host": "dev.azure.com", "orgs": ["xxxit"], "credential_env": "AZURE_PAT"},
-            {"type": "gitlab", "host": "gitlab.company.com", "orgs": ["platform-team"], "credential_env": "GITLAB_TOKEN"}
-        ]"""
-        with patch.dict(os.environ, {"GIT_PROVIDERS": config}):
-            providers = load_providers()
-            assert len(providers) == 2
-            assert providers[1].type == "gitlab"
+    def test_load_from_env_json(self, monkeypatch):
+        monkeypatch.setenv("GIT_PROVIDERS", SINGLE_PROVIDER_CONFIG)
+        providers = load_providers()
+        assert len(providers) == 1
+        assert providers[0].host == "dev.azure.com"
 
+    def test_load_empty_returns_empty_list(self, monkeypatch):
+        monkeypatch.delenv("GIT_PROVIDERS", raising=False)
+        providers = load_providers()
+        assert providers == []
 
-class TestValidateRepoUrl:
-    @pytest.fixture
-    def providers(self):
-        return [
-            GitProvider(type="azure", host="dev.azure.com", orgs=["xxxit", "xxxplatform"], credential_env="AZURE_PAT"),
-            GitProvider(type="gitlab", host="gitlab.company.com", orgs=["platform-team", "infra"], credential_env="GITLAB_TOKEN"),
-        ]
+    def test_load_multiple_providers(self, monkeypatch):
+        monkeypatch.setenv("GIT_PROVIDERS", MULTI_PROVIDER_CONFIG)
+        providers = load_providers()
+        assert len(providers) == 2
+        assert providers[1].type == "gitlab"
 
+
+@pytest.fixture(scope="module")
+def providers():
+    return [
+        GitProvider(type="azure", host="dev.azure.com", orgs=["xxxit", "xxxplatform"], credential_env="AZURE_PAT"),
+        GitProvider(type="gitlab", host="gitlab.company.com", orgs=["platform-team", "infra"], credential_env="GITLAB_TOKEN"),
+    ]
+
+
+class TestValidateRepoUrl:
     def test_valid_azure_url(self, providers):
         provider = validate_repo_url(
             "https://dev.azure.com/xxxit/project/_git/repo",
@@ -1,60 +1,161 @@
 # tests/test_health.py
+import threading
+import time
+
 import pytest
-from httpx import AsyncClient, ASGITransport
+from httpx import AsyncClient
+from redis import Redis
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 from unittest.mock import patch, MagicMock
 
-from ansible_runner_service.main import app
-from ansible_runner_service.health import get_worker_info, get_version_info
+from ansible_runner_service import main
+from ansible_runner_service.health import (
+    TTLCache,
+    check_mariadb,
+    check_redis,
+    get_queue_depth,
+    get_worker_info,
+    get_version_info,
+)
+
+from fakes import FakeRedis
 
 
-@pytest.fixture
-def client():
-    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+@pytest.fixture(autouse=True)
+def _fresh_health_caches():
+    """Each test probes dependencies instead of reading a cached result."""
+    main._ready_cache.invalidate()
+    main._details_cache.invalidate()
 
 
 class TestHealthLive:
-    async def test_health_live_returns_ok(self, client: AsyncClient):
-        response = await client.get("/health/live")
+    async def test_health_live_returns_ok(self, asgi_client: AsyncClient):
+        response = await asgi_client.get("/health/live")
 
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
+    async def test_health_live_reuses_prebuilt_response(self, asgi_client: AsyncClient):
+        await asgi_client.get("/health/live")
+        response = await asgi_client.get("/health/live")
+
+        assert response.json() == {"status": "ok"}
+        assert response.headers["content-type"] == "application/json"
+        assert main._HEALTH_OK.background is None
+
 
 class TestHealthReady:
-    async def test_health_ready_success(self, client: AsyncClient):
+    async def test_health_ready_success(self, asgi_client: AsyncClient):
         """Returns 200 when Redis and MariaDB are reachable."""
         with patch("ansible_runner_service.main.check_redis", return_value=(True, 5)):
             with patch("ansible_runner_service.main.check_mariadb", return_value=(True, 5)):
-                response = await client.get("/health/ready")
+                response = await asgi_client.get("/health/ready")
 
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
-    async def test_health_ready_redis_down(self, client: AsyncClient):
+    async def test_health_ready_redis_down(self, asgi_client: AsyncClient):
         """Returns 503 when Redis is unreachable."""
         with patch("ansible_runner_service.main.check_redis", return_value=(False, 0)):
             with patch("ansible_runner_service.main.check_mariadb", return_value=(True, 5)):
-                response = await client.get("/health/ready")
+                response = await asgi_client.get("/health/ready")
 
         assert response.status_code == 503
         data = response.json()
         assert data["status"] == "error"
         assert "redis" in data["reason"]
 
-    async def test_health_ready_mariadb_down(self, client: AsyncClient):
+    async def test_health_ready_mariadb_down(self, asgi_client: AsyncClient):
         """Returns 503 when MariaDB is unreachable."""
         with patch("ansible_runner_service.main.check_redis", return_value=(True, 5)):
             with patch("ansible_runner_service.main.check_mariadb", return_value=(False, 0)):
-                response = await client.get("/health/ready")
+                response = await asgi_client.get("/health/ready")
 
         assert response.status_code == 503
         data = response.json()
         assert data["status"] == "error"
         assert "mariadb" in data["reason"]
 
+    async def test_health_ready_reuses_result_within_ttl(self, asgi_client: AsyncClient):
+        """Back-to-back probes run the dependency checks once."""
+        with patch("ansible_runner_service.main.check_redis", return_value=(True, 5)) as mock_redis:
+            with patch("ansible_runner_service.main.check_mariadb", return_value=(True, 5)) as mock_db:
+                first = await asgi_client.get("/health/ready")
+                second = await asgi_client.get("/health/ready")
+
+        assert first.status_code == second.status_code == 200
+        mock_redis.assert_called_once()
+        mock_db.assert_called_once()
+
+    async def test_health_ready_probes_dependencies_concurrently(self, asgi_client: AsyncClient):
+        """The Redis probe runs while the MariaDB probe is still in flight."""
+        mariadb_started = threading.Event()
+
+        def slow_redis(redis):
+            return mariadb_started.wait(timeout=2), 1
+
+        def slow_mariadb(session):
+            mariadb_started.set()
+            return True, 1
+
+        with patch("ansible_runner_service.main.check_redis", side_effect=slow_redis):
+            with patch("ansible_runner_service.main.check_mariadb", side_effect=slow_mariadb):
+                response = await asgi_client.get("/health/ready")
+
+        assert response.status_code == 200
+
+
+class TestTTLCache:
+    def test_recomputes_after_expiry(self):
+        cache = TTLCache(ttl=0.05)
+        compute = MagicMock(side_effect=["a", "b"])
+
+        assert cache.get(compute) == "a"
+        assert cache.get(compute) == "a"
+        time.sleep(0.06)
+        assert cache.get(compute) == "b"
+        assert compute.call_count == 2
+
+    def test_invalidate_forces_recompute(self):
+        cache = TTLCache(ttl=60.0)
+        compute = MagicMock(side_effect=["a", "b"])
+
+        cache.get(compute)
+        cache.invalidate()
+
+        assert cache.get(compute) == "b"
+
+
+class TestGetRedis:
+    def test_get_redis_reuses_one_client(self, monkeypatch):
+        """Every request shares one Redis client and connection pool."""
+        monkeypatch.setattr(main, "_redis", None)
+
+        first = main.get_redis()
+
+        assert main.get_redis() is first
+        kwargs = first.connection_pool.connection_kwargs
+        assert kwargs["socket_keepalive"] is True
+        assert kwargs["health_check_interval"] == 30
+        # Short timeouts are for health probes only; keep redis-py's default
+        default_kwargs = Redis().connection_pool.connection_kwargs
+        assert kwargs.get("socket_timeout") == default_kwargs.get("socket_timeout")
+
+    def test_probe_redis_has_short_timeouts(self, monkeypatch):
+        monkeypatch.setattr(main, "_probe_redis", None)
+
+        probe = main.get_probe_redis()
+
+        assert main.get_probe_redis() is probe
+        assert probe is not main.get_redis()
+        kwargs = probe.connection_pool.connection_kwargs
+        assert kwargs["socket_timeout"] == main.REDIS_PROBE_TIMEOUT
+        assert kwargs["socket_connect_timeout"] == main.REDIS_PROBE_TIMEOUT
+
 
 class TestHealthDetails:
-    async def test_health_details_structure(self, client: AsyncClient):
+    async def test_health_details_structure(self, asgi_client: AsyncClient):
         """Returns full health details with correct structure."""
         with patch("ansible_runner_service.main.check_redis", return_value=(True, 2)):
             with patch("ansible_runner_service.main.check_mariadb", return_value=(True, 3)):
@@ -62,7 +163,7 @@ class TestHealthDetails:
                     with patch("ansible_runner_service.main.get_queue_depth", return_value=5):
                         with patch("ansible_runner_service.main.get_jobs_last_hour", return_value=42):
                             with patch("ansible_runner_service.main.get_version_info", return_value={"app": "0.1.0", "ansible_core": "2.20.2", "python": "3.11.5"}):
-                                response = await client.get("/health/details")
+                                response = await asgi_client.get("/health/details")
 
         assert response.status_code == 200
         data = response.json()
@@ -92,20 +193,69 @@ class TestHealthDetails:
         assert data["version"]["ansible_core"] == "2.20.2"
         assert data["version"]["python"] == "3.11.5"
 
+    async def test_health_details_reuses_body_within_ttl(self, asgi_client: AsyncClient):
+        """Back-to-back requests are served from the cached JSON body."""
+        with patch("ansible_runner_service.main.check_redis", return_value=(True, 2)) as mock_redis:
+            with patch("ansible_runner_service.main.check_mariadb", return_value=(True, 3)):
+                with patch("ansible_runner_service.main.get_worker_info", return_value={"count": 1, "queues": []}):
+                    with patch("ansible_runner_service.main.get_queue_depth", return_value=0):
+                        with patch("ansible_runner_service.main.get_jobs_last_hour", return_value=0):
+                            first = await asgi_client.get("/health/details")
+                            second = await asgi_client.get("/health/details")
+
+        assert first.content == second.content
+        assert second.headers["content-type"] == "application/json"
+        mock_redis.assert_called_once()
+
 
 class TestHealthHelpers:
     def test_get_worker_info(self):
         """Get worker count and queues from Redis."""
-        mock_redis = MagicMock()
-        mock_redis.smembers.return_value = {b"rq:worker:worker1", b"rq:worker:worker2"}
-        mock_redis.keys.return_value = [b"rq:queue:default", b"rq:queue:high"]
+        redis = FakeRedis(
+            workers={b"rq:worker:worker1", b"rq:worker:worker2"},
+            queues={b"rq:queue:default", b"rq:queue:high"},
+        )
 
-        info = get_worker_info(mock_redis)
+        info = get_worker_info(redis)
 
         assert info["count"] == 2
         assert "default" in info["queues"]
         assert "high" in info["queues"]
 
+    def test_get_queue_depth_sums_registered_queues(self):
+        """Queue depth sums LLEN over the rq:queues registry."""
+        redis = FakeRedis(
+            queues={b"rq:queue:default", b"rq:queue:high"},
+            queue_lengths={b"rq:queue:default": 3, b"rq:queue:high": 2},
+        )
+
+        assert get_queue_depth(redis) == 5
+
+    def test_check_redis_ok(self):
+        ok, latency_ms = check_redis(FakeRedis())
+
+        assert ok is True
+        assert latency_ms >= 0
+
+    def test_check_mariadb_sends_no_sql(self):
+        """The probe relies on the pool's checkout ping, not a SQL query."""
+        engine = create_engine("sqlite://")
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        with Session(engine) as session:
+            ok, latency_ms = check_mariadb(session)
+
+        assert ok is True
+        assert latency_ms >= 0
+        assert statements == []
+
+    def test_check_mariadb_checkout_failure(self):
+        session = MagicMock()
+        session.connection.side_effect = OSError
+
+        assert check_mariadb(session) == (False, 0)
+
     def test_get_version_info(self):
         """Get app and ansible versions."""
         info = get_version_info()
@@ -113,3 +263,13 @@ class TestHealthHelpers:
         assert "app" in info
         assert "ansible_core" in info
         assert "python" in info
+
+    def test_get_version_info_is_computed_once(self):
+        """Version lookups run once per process, without shelling out."""
+        get_version_info.cache_clear()
+        with patch("ansible_runner_service.health.subprocess.run") as mock_run:
+            first = get_version_info()
+            second = get_version_info()
+
+        assert first is second
+        mock_run.assert_not_called()
@@ -1,9 +1,13 @@
 # tests/test_job_store.py
+import json
+
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
-from ansible_runner_service.job_store import JobStore, Job, JobStatus
+from ansible_runner_service.job_store import JobStore, Job, JobResult, JobStatus
+
+from fakes import FakeRedis
 
 
 @pytest.fixture
@@ -63,12 +67,16 @@ class TestJobStore:
         job_store.update_status("test-123", JobStatus.RUNNING)
 
         mock_redis.hset.assert_called()
+        mock_redis.publish.assert_not_called()
+
+    def test_update_job_status_publishes_terminal_status(self, job_store, mock_redis):
+        job_store.update_status("test-123", JobStatus.SUCCESSFUL)
+
+        mock_redis.publish.assert_called_once_with("job:test-123:events", "successful")
 
 
 class TestJobStoreWithDB:
     def test_create_job_writes_to_db(self):
-        from ansible_runner_service.job_store import JobStore
-
         mock_redis = MagicMock()
         mock_repo = MagicMock()
 
@@ -87,9 +95,6 @@ class TestJobStoreWithDB:
         assert call_kwargs["inventory"] == "localhost,"
 
     def test_update_status_writes_to_db(self):
-        from ansible_runner_service.job_store import JobStore, JobStatus
-        from datetime import datetime, timezone
-
         mock_redis = MagicMock()
         mock_repo = MagicMock()
 
@@ -116,8 +121,6 @@ class TestJobStoreWithDB:
 
     def test_create_job_works_without_repo(self):
         """Backwards compatibility: works without repository."""
-        from ansible_runner_service.job_store import JobStore
-
         mock_redis = MagicMock()
         store = JobStore(mock_redis)  # No repository
 
@@ -131,8 +134,6 @@ class TestJobStoreWithDB:
 
     def test_create_job_rollbacks_redis_on_db_failure(self):
         """Strict consistency: Redis key deleted if DB write fails."""
-        from ansible_runner_service.job_store import JobStore
-
         mock_redis = MagicMock()
         mock_repo = MagicMock()
         mock_repo.create.side_effect = Exception("DB connection failed")
@@ -151,8 +152,6 @@ class TestJobStoreWithDB:
 
     def test_update_status_no_redis_update_on_db_failure(self):
         """Strict consistency: Redis not updated if DB write fails."""
-        from ansible_runner_service.job_store import JobStore, JobStatus
-
         mock_redis = MagicMock()
         mock_repo = MagicMock()
         mock_repo.update_status.side_effect = Exception("DB connection failed")
@@ -256,40 +255,10 @@ class TestJobStoreSourceFields:
         assert job.source_branch == "main"
 
 
-class _FakeRedis:
-    """Minimal in-memory Redis mock supporting hset/hgetall/expire/delete."""
-
-    def __init__(self):
-        self._data: dict[str, dict[bytes, bytes]] = {}
-
-    def hset(self, name: str, key=None, value=None, mapping=None):
-        if name not in self._data:
-            self._data[name] = {}
-        if mapping:
-            for k, v in mapping.items():
-                self._data[name][k.encode() if isinstance(k, str) else k] = (
-                    v.encode() if isinstance(v, str) else v
-                )
-        if key is not None and value is not None:
-            k = key.encode() if isinstance(key, str) else key
-            v = value.encode() if isinstance(value, str) else value
-            self._data[name][k] = v
-
-    def hgetall(self, name: str) -> dict[bytes, bytes]:
-        return dict(self._data.get(name, {}))
-
-    def expire(self, name: str, time: int):
-        pass
-
-    def delete(self, *names):
-        for name in names:
-            self._data.pop(name, None)
-
-
 class TestJobStoreInventoryAndOptions:
     @pytest.fixture
     def redis(self):
-        return _FakeRedis()
+        return FakeRedis()
 
     def test_create_job_with_inline_inventory(self, redis):
         store = JobStore(redis)
@@ -356,3 +325,42 @@ def test_create_job_with_local_role(job_store):
     )
     assert job.source_type == "local"
     assert job.source_target == "role"
+
+
+class TestJobResultStorage:
+    @pytest.fixture
+    def store(self):
+        return JobStore(FakeRedis())
+
+    def _finish(self, store, stdout):
+        job = store.create_job(playbook="test.yml", extra_vars={}, inventory="localhost,")
+        store.update_status(
+            job.job_id,
+            JobStatus.SUCCESSFUL,
+            result=JobResult(rc=0, stdout=stdout, stats={"ok": {"localhost": 1}}),
+        )
+        return job.job_id
+
+    def test_large_result_is_compressed(self, store):
+        stdout = "TASK [debug] ok: [localhost]\n" * 200
+        job_id = self._finish(store, stdout)
+
+        raw = store.redis.hgetall(f"job:{job_id}")[b"result"]
+        assert raw.startswith(b"ZJ\x01")
+        assert len(raw) < len(stdout)
+        assert store.get_job(job_id).result.stdout == stdout
+
+    def test_small_result_stays_json(self, store):
+        job_id = self._finish(store, "ok")
+
+        raw = store.redis.hgetall(f"job:{job_id}")[b"result"]
+        assert json.loads(raw)["stdout"] == "ok"
+        assert store.get_job(job_id).result.stdout == "ok"
+
+    def test_reads_legacy_json_result(self, store):
+        job_id = self._finish(store, "ok")
+        legacy = json.dumps({"rc": 2, "stdout": "old", "stats": {}})
+        store.redis.hset(f"job:{job_id}", "result", legacy)
+
+        result = store.get_job(job_id).result
+        assert result == JobResult(rc=2, stdout="old", stats={})
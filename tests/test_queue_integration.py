@@ -12,16 +12,26 @@ import pytest
 from redis import Redis
 from rq.job import Job
 
+from ansible_runner_service.queue import enqueue_job
+
 pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
-def redis():
-    """Real Redis connection for queue tests."""
-    r = Redis()
+@pytest.fixture(scope="module")
+def redis(redis_test_db: int):
+    """Real Redis connection shared by every queue test in this module."""
+    r = Redis(db=redis_test_db)
     r.flushdb()  # Clean slate
     yield r
     r.flushdb()
+    r.close()
+
+
+@pytest.fixture(autouse=True)
+def _flush_redis(redis):
+    """Isolate tests with one FLUSHDB instead of a fresh connection each."""
+    yield
+    redis.flushdb()
 
 
 def _find_job_by_kwarg(redis, key, value):
@@ -47,8 +57,6 @@ class TestQueueArgumentPreservation:
         where our job_id parameter was intercepted by rq instead of
         being passed to the worker function.
         """
-        from ansible_runner_service.queue import enqueue_job
-
         # Enqueue a job with all arguments
         enqueue_job(
             job_id="test-queue-123",
@@ -66,8 +74,6 @@ class TestQueueArgumentPreservation:
 
     def test_enqueue_references_correct_worker_function(self, redis):
         """Verify enqueued job references the correct worker function."""
-        from ansible_runner_service.queue import enqueue_job
-
         enqueue_job(
             job_id="test-func-123",
             playbook="test.yml",
@@ -82,8 +88,6 @@ class TestQueueArgumentPreservation:
 
     def test_enqueue_with_empty_extra_vars(self, redis):
         """Verify empty extra_vars dict is preserved."""
-        from ansible_runner_service.queue import enqueue_job
-
         enqueue_job(
             job_id="test-empty-vars",
             playbook="test.yml",
@@ -98,8 +102,6 @@ class TestQueueArgumentPreservation:
 
     def test_enqueue_preserves_local_playbook_source_config(self, redis):
         """Verify local playbook source_config is preserved through queue."""
-        from ansible_runner_service.queue import enqueue_job
-
         source_config = {"type": "local", "target": "playbook", "path": "hello.yml"}
         enqueue_job(
             job_id="test-local-source",
@@ -116,8 +118,6 @@ class TestQueueArgumentPreservation:
 
     def test_enqueue_preserves_git_playbook_source_config(self, redis):
         """Verify git playbook source_config is preserved through queue."""
-        from ansible_runner_service.queue import enqueue_job
-
         source_config = {
             "type": "git",
             "target": "playbook",
@@ -142,8 +142,6 @@ class TestQueueArgumentPreservation:
 
     def test_enqueue_preserves_git_role_source_config(self, redis):
         """Verify git role source_config is preserved through queue."""
-        from ansible_runner_service.queue import enqueue_job
-
         source_config = {
             "type": "git",
             "target": "role",
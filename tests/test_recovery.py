@@ -3,6 +3,8 @@ import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch
 
+from fakes import FakeRedis
+
 
 class TestRecoverStaleJobs:
     def test_marks_stale_running_jobs_as_failed(self):
@@ -23,10 +25,9 @@ class TestRecoverStaleJobs:
         mock_repo = MagicMock()
         mock_repo.list_stale_running_jobs.return_value = [stale_job]
 
-        mock_redis = MagicMock()
-        mock_redis.exists.return_value = False  # Not in Redis
+        redis = FakeRedis()  # Not in Redis
 
-        recover_stale_jobs(mock_repo, mock_redis)
+        recover_stale_jobs(mock_repo, redis)
 
         mock_repo.update_status.assert_called_once_with(
             "stale-123",
@@ -51,10 +52,21 @@ class TestRecoverStaleJobs:
         mock_repo = MagicMock()
         mock_repo.list_stale_running_jobs.return_value = [stale_job]
 
-        mock_redis = MagicMock()
-        mock_redis.exists.return_value = True  # Still in Redis
+        redis = FakeRedis()
+        redis.hset("job:stale-123", mapping={"status": "running"})  # Still in Redis
 
-        recover_stale_jobs(mock_repo, mock_redis)
+        recover_stale_jobs(mock_repo, redis)
 
         # Should NOT update since job is still active in Redis
         mock_repo.update_status.assert_not_called()
+
+    def test_no_stale_jobs_skips_redis(self):
+        from ansible_runner_service.main import recover_stale_jobs
+
+        mock_repo = MagicMock()
+        mock_repo.list_stale_running_jobs.return_value = []
+        mock_redis = MagicMock()
+
+        recover_stale_jobs(mock_repo, mock_redis)
+
+        mock_redis.pipeline.assert_not_called()
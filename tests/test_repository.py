@@ -61,34 +61,30 @@ class TestJobRepository:
         assert job is None
 
     def test_update_status(self):
-        from ansible_runner_service.repository import JobRepository
         from ansible_runner_service.models import JobModel
+        from ansible_runner_service.repository import JobRepository
 
         mock_session = MagicMock()
-        mock_job = JobModel(
-            id="test-123",
-            status="pending",
-            playbook="hello.yml",
-            extra_vars={},
-            inventory="localhost,",
-            created_at=datetime.now(timezone.utc),
-        )
-        mock_session.get.return_value = mock_job
+        mock_session.execute.return_value.rowcount = 1
 
         repo = JobRepository(mock_session)
         now = datetime.now(timezone.utc)
         result = repo.update_status("test-123", "running", started_at=now)
 
         assert result is True
-        assert mock_job.status == "running"
-        assert mock_job.started_at == now
+        mock_session.get.assert_not_called()
+        stmt = mock_session.execute.call_args[0][0]
+        params = stmt.compile().params
+        assert params["status"] == "running"
+        assert params["started_at"] == now
+        assert stmt.whereclause.compare(JobModel.id == "test-123")
         mock_session.commit.assert_called_once()
 
     def test_update_status_job_not_found(self):
         from ansible_runner_service.repository import JobRepository
 
         mock_session = MagicMock()
-        mock_session.get.return_value = None
+        mock_session.execute.return_value.rowcount = 0
 
         repo = JobRepository(mock_session)
         result = repo.update_status("nonexistent", "running")
@@ -134,6 +134,7 @@ class TestGitPlaybookSource:
         assert source.type == "git"
         assert source.target == "playbook"
         assert source.branch == "main"  # default
+        assert source.submodules is False
 
     def test_with_branch(self):
         source = GitPlaybookSource(
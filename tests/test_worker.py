@@ -157,7 +157,7 @@ class TestPathTraversalProtection:
         mock_validate.return_value = MagicMock()
 
         # Simulate clone: create repo_dir with a symlink that escapes
-        def fake_clone(repo_url, branch, target_dir, provider):
+        def fake_clone(repo_url, branch, target_dir, provider, recurse_submodules=False):
             os.makedirs(target_dir)
             # Create a symlink pointing outside the repo
             escape_target = tmp_path / "secret"
@@ -192,7 +192,7 @@ class TestPathTraversalProtection:
         """Path with '..' segments escaping repo_dir must be rejected."""
         mock_validate.return_value = MagicMock()
 
-        def fake_clone(repo_url, branch, target_dir, provider):
+        def fake_clone(repo_url, branch, target_dir, provider, recurse_submodules=False):
             os.makedirs(os.path.join(target_dir, "deploy"))
             # Create a file outside repo_dir that the traversal would reach
             (tmp_path / "etc_shadow").write_text("---")
@@ -212,6 +212,62 @@ class TestPathTraversalProtection:
             _execute_git_playbook(source_config, {}, "localhost,")
 
 
+class TestGitPlaybookSubmodules:
+    @patch("ansible_runner_service.worker.run_playbook")
+    @patch("ansible_runner_service.worker.validate_repo_url")
+    @patch("ansible_runner_service.worker.load_providers")
+    @patch("ansible_runner_service.worker.clone_repo")
+    def test_submodules_flag_reaches_clone(
+        self,
+        mock_clone,
+        mock_load_providers,
+        mock_validate,
+        mock_run,
+    ):
+        mock_validate.return_value = MagicMock()
+        mock_clone.side_effect = lambda target_dir, **kwargs: os.makedirs(target_dir)
+        source_config = {
+            "type": "git",
+            "target": "playbook",
+            "repo": "https://dev.azure.com/xxxit/p/_git/r",
+            "branch": "main",
+            "path": "site.yml",
+            "submodules": True,
+        }
+
+        from ansible_runner_service.worker import _execute_git_playbook
+        _execute_git_playbook(source_config, {}, "localhost,")
+
+        assert mock_clone.call_args.kwargs["recurse_submodules"] is True
+
+    @patch("ansible_runner_service.worker.run_playbook")
+    @patch("ansible_runner_service.worker.validate_repo_url")
+    @patch("ansible_runner_service.worker.load_providers")
+    @patch("ansible_runner_service.worker.clone_repo")
+    def test_submodules_default_off(
+        self,
+        mock_clone,
+        mock_load_providers,
+        mock_validate,
+        mock_run,
+    ):
+        """Jobs queued before the field existed carry no submodules key."""
+        mock_validate.return_value = MagicMock()
+        mock_clone.side_effect = lambda target_dir, **kwargs: os.makedirs(target_dir)
+        source_config = {
+            "type": "git",
+            "target": "playbook",
+            "repo": "https://dev.azure.com/xxxit/p/_git/r",
+            "branch": "main",
+            "path": "site.yml",
+        }
+
+        from ansible_runner_service.worker import _execute_git_playbook
+        _execute_git_playbook(source_config, {}, "localhost,")
+
+        assert mock_clone.call_args.kwargs["recurse_submodules"] is False
+
+
 class TestExecuteJobWithGitSource:
     @patch("ansible_runner_service.worker.JobStore")
     @patch("ansible_runner_service.worker.JobRepository")